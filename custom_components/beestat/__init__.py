@@ -1,23 +1,28 @@
 """The Beestat integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .api import BeestatApiClient, BeestatApiError
+from .api import BeestatApiClient, BeestatApiError, BeestatRateLimitError
 from .const import (
     CONF_API_KEY,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL_MINUTES,
     DOMAIN,
+    MAX_BACKOFF_INTERVAL_SECONDS,
     PLATFORMS,
 )
+from .coordinator import BeestatDataUpdateCoordinator
+from .data import NormalizedThermostats
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,20 +36,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # request Beestat/ecobee sync on a slower cadence (default 1 hour).
     sync_interval = timedelta(hours=1)
 
-    async def _async_update_data():
-        try:
-            now = datetime.now(timezone.utc)  # noqa: UP017
-            last_sync: datetime | None = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("last_sync")
-            if last_sync is None or (now - last_sync) >= sync_interval:
-                _LOGGER.debug("Triggering Beestat sync (interval=%s)", sync_interval)
-                await client.async_sync_thermostats()
-                await client.async_sync_sensors()
-                hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})["last_sync"] = now
-
-            thermostats = await client.async_get_thermostats()
-            ecobee_thermostats = await client.async_get_ecobee_thermostats()
-        except BeestatApiError as err:
-            raise UpdateFailed(str(err)) from err
+    update_minutes = entry.options.get(
+        CONF_UPDATE_INTERVAL,
+        DEFAULT_UPDATE_INTERVAL_MINUTES,
+    )
+    update_interval = timedelta(minutes=update_minutes)
+    max_backoff = max(update_interval, timedelta(seconds=MAX_BACKOFF_INTERVAL_SECONDS))
+    throttled_refreshes = 0
+
+    async def _async_fetch_data() -> NormalizedThermostats:
+        thermostats, ecobee_thermostats = await asyncio.gather(
+            client.async_get_thermostats(),
+            client.async_get_ecobee_thermostats(),
+        )
 
         if not thermostats:
             raise UpdateFailed("No thermostat data returned from Beestat API")
@@ -64,18 +68,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 if isinstance(remote_sensors, list):
                     thermostat["remote_sensors"] = remote_sensors
 
-        return thermostats
+        # Index once per refresh so entity state reads are dict lookups, not list scans.
+        return NormalizedThermostats.from_thermostats(thermostats)
+
+    async def _async_sync_and_push(_now: datetime | None = None) -> None:
+        """Run a Beestat sync, then push the fresh data into the coordinator."""
+        if throttled_refreshes:
+            # Don't add sync traffic while the poll is backing off.
+            return
+        if not coordinator.listener_count:
+            # No entity is listening, so the coordinator isn't polling either; don't
+            # spend a tick's four POSTs (two syncs, two reads) on nobody.
+            return
+        _LOGGER.debug("Triggering Beestat sync (interval=%s)", sync_interval)
+        try:
+            await asyncio.gather(
+                client.async_sync_thermostats(),
+                client.async_sync_sensors(),
+            )
+            data = await _async_fetch_data()
+        except (BeestatApiError, UpdateFailed) as err:
+            _LOGGER.warning("Beestat sync failed: %s", err)
+            return
+        coordinator.async_set_updated_data(data)
 
-    update_minutes = entry.options.get(
-        CONF_UPDATE_INTERVAL,
-        DEFAULT_UPDATE_INTERVAL_MINUTES,
-    )
-    coordinator = DataUpdateCoordinator(
+    async def _async_update_data():
+        nonlocal throttled_refreshes
+        try:
+            data = await _async_fetch_data()
+        except BeestatRateLimitError as err:
+            # Back off exponentially (honoring Retry-After) instead of polling a
+            # throttled/unavailable API at the normal cadence.
+            throttled_refreshes += 1
+            backoff = min(max_backoff, update_interval * 2**throttled_refreshes)
+            if err.retry_after is not None:
+                # Honor Retry-After as a floor, but never wait longer than our own
+                # cap, so a single header can't park polling for days.
+                retry_after = min(err.retry_after, max_backoff.total_seconds())
+                backoff = max(backoff, timedelta(seconds=retry_after))
+            coordinator.update_interval = backoff
+            _LOGGER.debug("Beestat API throttled; next refresh in %s", backoff)
+            raise UpdateFailed(str(err)) from err
+        except BeestatApiError as err:
+            raise UpdateFailed(str(err)) from err
+
+        if throttled_refreshes:
+            throttled_refreshes = 0
+            coordinator.update_interval = update_interval
+        return data
+
+    coordinator = BeestatDataUpdateCoordinator(
         hass,
         _LOGGER,
         name=DOMAIN,
         update_method=_async_update_data,
-        update_interval=timedelta(minutes=update_minutes),
+        update_interval=update_interval,
     )
 
     try:
@@ -86,12 +133,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "client": client,
         "coordinator": coordinator,
-        "last_sync": hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("last_sync"),
     }
 
+    # The sync runs on its own timer so polls stay a plain read; the synced data is
+    # pushed into the coordinator when it lands.
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_sync_and_push, sync_interval, name="Beestat sync")
+    )
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Kick off a sync for fresh data at startup once the entities are listening, so
+    # the push can't land between their setup probe and listener registration.
+    entry.async_create_background_task(hass, _async_sync_and_push(), "beestat_sync")
     return True
 
 
@@ -99,7 +153,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if entry_data is not None:
+            # Shared requests run as their own tasks; don't let them outlive the entry.
+            entry_data["client"].cancel_inflight()
     return unload_ok
 
 
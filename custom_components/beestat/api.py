@@ -1,19 +1,51 @@
 """Beestat API client."""
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import API_ENDPOINT
 
 
+# Serialized once; reused whenever a caller passes empty arguments.
+_EMPTY_ARGUMENTS = orjson.dumps({}).decode()
+
+# Bound every request so a stalled connection can't wedge a coordinator refresh.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
 class BeestatApiError(Exception):
     """Beestat API error."""
 
 
+class BeestatRateLimitError(BeestatApiError):
+    """Beestat is throttling us (HTTP 429) or temporarily unavailable (HTTP 5xx)."""
+
+    def __init__(self, message: str, retry_after: int | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> int | None:
+    """Return the Retry-After delay in seconds, if given in delta-seconds form.
+
+    Only plain non-negative integers are accepted (RFC 9110 delta-seconds), so
+    values like "inf" or "1e20" can't reach timedelta().
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if not (value.isascii() and value.isdigit()):
+        return None
+    return int(value)
+
+
 def build_payload(
     api_key: str,
     resource: str,
@@ -32,35 +64,88 @@ def build_payload(
     }
 
     if arguments is not None:
-        payload["arguments"] = json.dumps(arguments)
+        payload["arguments"] = (
+            orjson.dumps(arguments).decode() if arguments else _EMPTY_ARGUMENTS
+        )
 
     return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class BeestatApiClient:
     """Simple Beestat API client."""
 
     api_key: str
     session: aiohttp.ClientSession
     logger: Any
+    _inflight: dict[tuple[str, str, str | None, int], asyncio.Future[Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Bumped around every sync so requests issued after it never join one sent before.
+    _sync_generation: int = field(default=0, init=False, repr=False)
 
     async def request(self, resource: str, method: str, arguments: dict[str, Any] | None = None) -> Any:
-        """POST to the Beestat API and return JSON data."""
+        """POST to the Beestat API and return JSON data.
+
+        Identical requests issued while one is already in flight share its result
+        instead of sending a second POST, unless a sync started or finished in
+        between.
+        """
         payload = build_payload(self.api_key, resource, method, arguments)
+        key = (resource, method, payload.get("arguments"), self._sync_generation)
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._async_post(payload))
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._request_done, key))
+        # Shield so one caller being cancelled doesn't cancel the request for the others.
+        return await asyncio.shield(future)
+
+    def _request_done(
+        self, key: tuple[str, str, str | None, int], future: asyncio.Future[Any]
+    ) -> None:
+        self._inflight.pop(key, None)
+        if not future.cancelled():
+            # Retrieve the error even if every caller was cancelled, so asyncio
+            # doesn't report it as never retrieved.
+            future.exception()
+
+    def cancel_inflight(self) -> None:
+        """Cancel requests that are still running, e.g. when the entry unloads."""
+        for future in list(self._inflight.values()):
+            future.cancel()
+
+    async def _async_post(self, payload: dict[str, Any]) -> Any:
+        """Send a single Beestat API request."""
+        # Encode the body ourselves (orjson ships with Home Assistant) rather than
+        # letting aiohttp run its stdlib-json JsonPayload path.
+        body = orjson.dumps(payload)
 
         try:
-            async with self.session.post(API_ENDPOINT, json=payload) as resp:
+            async with self.session.post(
+                API_ENDPOINT,
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=_REQUEST_TIMEOUT,
+            ) as resp:
                 if resp.status != 200:
                     text = await resp.text()
                     self.logger.debug(
                         "Beestat API non-200 response (status=%s) body=%s", resp.status, text
                     )
+                    if resp.status == 429 or resp.status >= 500:
+                        raise BeestatRateLimitError(
+                            f"HTTP {resp.status}: {text}",
+                            parse_retry_after(resp.headers.get("Retry-After")),
+                        )
                     raise BeestatApiError(f"HTTP {resp.status}: {text}")
-                data = await resp.json()
+                data = await resp.json(loads=orjson.loads)
         except aiohttp.ClientError as err:
             raise BeestatApiError(f"Client error: {err}") from err
-        except aiohttp.ContentTypeError as err:
+        except TimeoutError as err:
+            raise BeestatApiError("Timed out talking to Beestat API") from err
+        except (aiohttp.ContentTypeError, orjson.JSONDecodeError) as err:
             raise BeestatApiError("Invalid response from Beestat API") from err
 
         if isinstance(data, dict):
@@ -97,11 +182,15 @@ class BeestatApiClient:
 
     async def async_sync_thermostats(self) -> None:
         """Trigger Beestat thermostat sync."""
+        self._sync_generation += 1
         await self.request("thermostat", "sync")
+        self._sync_generation += 1
 
     async def async_sync_sensors(self) -> None:
         """Trigger Beestat sensor sync."""
+        self._sync_generation += 1
         await self.request("sensor", "sync")
+        self._sync_generation += 1
 
     async def async_validate_key(self) -> None:
         """Validate the API key by attempting a lightweight call."""
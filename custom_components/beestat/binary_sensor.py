@@ -1,7 +1,7 @@
 """Binary sensor platform for Beestat occupancy and comfort-profile usage."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,14 +14,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
 from .const import DOMAIN
 from .data import (
-    extract_remote_sensors,
     extract_thermostat_sensor,
-    find_thermostat,
     remote_sensor_id,
     remote_sensor_in_use,
     remote_sensor_name,
@@ -31,9 +27,10 @@ from .data import (
     thermostat_is_in_hold,
     thermostat_name,
 )
+from .entity import BeestatCoordinatorEntity, suggested_object_id
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BeestatBinarySensorDescription(BinarySensorEntityDescription):
     """Describe a Beestat binary sensor.
 
@@ -49,13 +46,13 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[BeestatBinarySensorDescription, ...] = (
         key="in_use",
         name="In Use",
         device_class=None,
-        value_fn=lambda sensor: remote_sensor_in_use(sensor),
+        value_fn=remote_sensor_in_use,
     ),
     BeestatBinarySensorDescription(
         key="occupancy",
         name="Presence",
         device_class=BinarySensorDeviceClass.OCCUPANCY,
-        value_fn=lambda sensor: remote_sensor_occupancy(sensor),
+        value_fn=remote_sensor_occupancy,
     ),
 )
 
@@ -65,17 +62,40 @@ THERMOSTAT_BINARY_SENSOR_DESCRIPTIONS: tuple[BeestatBinarySensorDescription, ...
         key="hold_active",
         name="Hold Active",
         device_class=None,
-        value_fn=lambda thermostat_sensor: thermostat_is_in_hold(thermostat_sensor),
+        value_fn=thermostat_is_in_hold,
     ),
     BeestatBinarySensorDescription(
         key="fan_running",
         name="Fan Running",
         device_class=None,
-        value_fn=lambda thermostat_sensor: thermostat_fan_is_running(thermostat_sensor),
+        value_fn=thermostat_fan_is_running,
     ),
 )
 
 
+# Thermostat-level keys read from the ecobee "thermostat" remote_sensor entry;
+# the rest are read from the thermostat dict itself (events, equipment status).
+_THERMOSTAT_SENSOR_KEYS = frozenset({"in_use", "occupancy"})
+
+
+def _thermostat_value_source(
+    thermostat: dict[str, Any],
+    thermostat_sensor: dict[str, Any],
+    key: str,
+) -> dict[str, Any]:
+    return thermostat_sensor if key in _THERMOSTAT_SENSOR_KEYS else thermostat
+
+
+def _reported_values(
+    candidates: Iterable[tuple[BeestatBinarySensorDescription, dict[str, Any]]],
+) -> Iterator[tuple[BeestatBinarySensorDescription, bool]]:
+    """Yield (description, value) for each candidate whose source reports a value."""
+    for description, source in candidates:
+        value = description.value_fn(source)
+        if value is not None:
+            yield description, value
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -85,45 +105,47 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     entities: list[BinarySensorEntity] = []
 
-    for thermostat in coordinator.data:
+    remotes_by_id = coordinator.data.remotes_by_id
+    for tid, thermostat in coordinator.data.by_id.items():
         # Thermostat-level presence / in-use (extracted from the ecobee "thermostat" sensor entry).
         thermostat_sensor = extract_thermostat_sensor(thermostat)
         if thermostat_sensor is not None:
-            for description in THERMOSTAT_BINARY_SENSOR_DESCRIPTIONS:
-                # Some thermostat-level values come from the special thermostat remote_sensor
-                # entry (presence/in-use), others come from the thermostat dict itself (events).
-                source = thermostat_sensor if description.key in {"in_use", "occupancy"} else thermostat
-                value = description.value_fn(source)
-                if value is None:
-                    continue
-                entities.append(
-                    BeestatThermostatBinarySensor(
-                        coordinator=coordinator,
-                        thermostat=thermostat,
-                        description=description,
-                    )
+            entities.extend(
+                BeestatThermostatBinarySensor(
+                    coordinator=coordinator,
+                    thermostat=thermostat,
+                    description=description,
+                    is_on=value,
+                )
+                for description, value in _reported_values(
+                    (d, _thermostat_value_source(thermostat, thermostat_sensor, d.key))
+                    for d in THERMOSTAT_BINARY_SENSOR_DESCRIPTIONS
                 )
+            )
 
         # Remote sensor presence / in-use.
-        for remote_sensor in extract_remote_sensors(thermostat):
-            for description in BINARY_SENSOR_DESCRIPTIONS:
-                if description.value_fn(remote_sensor) is None:
-                    continue
-                entities.append(
-                    BeestatRemoteBinarySensor(
-                        coordinator=coordinator,
-                        thermostat=thermostat,
-                        remote_sensor=remote_sensor,
-                        description=description,
-                    )
+        for remote_sensor in remotes_by_id[tid].values():
+            entities.extend(
+                BeestatRemoteBinarySensor(
+                    coordinator=coordinator,
+                    thermostat=thermostat,
+                    remote_sensor=remote_sensor,
+                    description=description,
+                    is_on=value,
                 )
+                for description, value in _reported_values(
+                    (d, remote_sensor) for d in BINARY_SENSOR_DESCRIPTIONS
+                )
+            )
 
     async_add_entities(entities)
 
 
-class BeestatThermostatBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class BeestatThermostatBinarySensor(BeestatCoordinatorEntity, BinarySensorEntity):
     """Representation of a Beestat thermostat-level binary sensor."""
 
+    __slots__ = ("_thermostat_id", "_thermostat_name")
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -131,13 +153,16 @@ class BeestatThermostatBinarySensor(CoordinatorEntity, BinarySensorEntity):
         coordinator,
         thermostat: dict[str, Any],
         description: BeestatBinarySensorDescription,
+        is_on: bool | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self._attr_name = description.name
+        self._attr_is_on = is_on
         self._thermostat_id = thermostat_id(thermostat)
         self._thermostat_name = thermostat_name(thermostat)
         self._attr_unique_id = f"{self._thermostat_id}_{description.key}"
-        self._attr_suggested_object_id = f"beestat_{slugify(self._thermostat_name)}_{description.key}"
+        self._attr_suggested_object_id = suggested_object_id(self._thermostat_name, description.key)
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._thermostat_id)},
             name=self._thermostat_name,
@@ -146,26 +171,23 @@ class BeestatThermostatBinarySensor(CoordinatorEntity, BinarySensorEntity):
         )
         self._attr_device_class = description.device_class
 
-    @property
-    def name(self) -> str:
-        return self.entity_description.name
-
-    @property
-    def is_on(self) -> bool | None:
-        thermostat = find_thermostat(self.coordinator.data, self._thermostat_id)
-        if thermostat is None:
-            return None
-        thermostat_sensor = extract_thermostat_sensor(thermostat)
-        if thermostat_sensor is None:
-            return None
+    def _update_attrs(self) -> None:
+        thermostat = self.coordinator.data.by_id.get(self._thermostat_id)
+        thermostat_sensor = extract_thermostat_sensor(thermostat) if thermostat is not None else None
+        if thermostat is None or thermostat_sensor is None:
+            self._attr_is_on = None
+            return
 
-        source = thermostat_sensor if self.entity_description.key in {"in_use", "occupancy"} else thermostat
-        return self.entity_description.value_fn(source)
+        self._attr_is_on = self.entity_description.value_fn(
+            _thermostat_value_source(thermostat, thermostat_sensor, self.entity_description.key)
+        )
 
 
-class BeestatRemoteBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class BeestatRemoteBinarySensor(BeestatCoordinatorEntity, BinarySensorEntity):
     """Representation of a Beestat remote sensor binary sensor."""
 
+    __slots__ = ("_thermostat_id", "_remote_sensor_id", "_remote_sensor_name")
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -174,14 +196,17 @@ class BeestatRemoteBinarySensor(CoordinatorEntity, BinarySensorEntity):
         thermostat: dict[str, Any],
         remote_sensor: dict[str, Any],
         description: BeestatBinarySensorDescription,
+        is_on: bool | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self._attr_name = description.name
+        self._attr_is_on = is_on
         self._thermostat_id = thermostat_id(thermostat)
         self._remote_sensor_id = remote_sensor_id(remote_sensor, self._thermostat_id)
         self._remote_sensor_name = remote_sensor_name(remote_sensor)
         self._attr_unique_id = f"{self._remote_sensor_id}_{description.key}"
-        self._attr_suggested_object_id = f"beestat_{slugify(self._remote_sensor_name)}_{description.key}"
+        self._attr_suggested_object_id = suggested_object_id(self._remote_sensor_name, description.key)
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._remote_sensor_id)},
             name=self._remote_sensor_name,
@@ -191,16 +216,8 @@ class BeestatRemoteBinarySensor(CoordinatorEntity, BinarySensorEntity):
         )
         self._attr_device_class = description.device_class
 
-    @property
-    def name(self) -> str:
-        return self.entity_description.name
-
-    @property
-    def is_on(self) -> bool | None:
-        thermostat = find_thermostat(self.coordinator.data, self._thermostat_id)
-        if thermostat is None:
-            return None
-        for sensor in extract_remote_sensors(thermostat):
-            if remote_sensor_id(sensor, self._thermostat_id) == self._remote_sensor_id:
-                return self.entity_description.value_fn(sensor)
-        return None
+    def _update_attrs(self) -> None:
+        sensor = self.coordinator.data.remotes_by_id.get(self._thermostat_id, {}).get(
+            self._remote_sensor_id
+        )
+        self._attr_is_on = self.entity_description.value_fn(sensor) if sensor is not None else None
@@ -11,6 +11,9 @@ CONF_UPDATE_INTERVAL = "update_interval"
 DEFAULT_UPDATE_INTERVAL_SECONDS = 300
 DEFAULT_UPDATE_INTERVAL_MINUTES = DEFAULT_UPDATE_INTERVAL_SECONDS // 60
 
+# Upper bound for the poll interval while backing off from throttling/5xx errors.
+MAX_BACKOFF_INTERVAL_SECONDS = 3600
+
 API_ENDPOINT = "https://api.beestat.io/"
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
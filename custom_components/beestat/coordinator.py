@@ -0,0 +1,46 @@
+"""Data update coordinator for Beestat."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .data import NormalizedThermostats
+
+
+class BeestatDataUpdateCoordinator(DataUpdateCoordinator[NormalizedThermostats]):
+    """Coordinator that also counts its listeners.
+
+    HA has no public "anyone listening?" check (async_contexts() skips listeners
+    registered without a context, as CoordinatorEntity's are), so we count them
+    here instead of reading the base class's private listener dict.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._listener_count = 0
+
+    @property
+    def listener_count(self) -> int:
+        """Return the number of registered update listeners."""
+        return self._listener_count
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._listener_count += 1
+        removed = False
+
+        @callback
+        def _remove_listener() -> None:
+            nonlocal removed
+            if not removed:
+                removed = True
+                self._listener_count -= 1
+            remove_listener()
+
+        return _remove_listener
@@ -1,11 +1,48 @@
-"""Data extraction helpers for Beestat entities."""
+"""Data extraction helpers for Beestat entities.
+
+Payloads come straight from JSON decoding, so the per-refresh traversal helpers
+check exact types (`type(x) is dict`) rather than paying for isinstance's
+subclass handling.
+"""
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-
-def pick_first_value(data: dict[str, Any], *keys: str) -> Any:
-    """Return the first non-None value from a dict for the provided keys."""
+# Lowercased capability "type" values, built once rather than on every lookup.
+_TEMPERATURE_CAPABILITIES = frozenset({"temperature", "temp"})
+_HUMIDITY_CAPABILITIES = frozenset({"humidity"})
+_OCCUPANCY_CAPABILITIES = frozenset({"occupancy", "presence", "occupied"})
+
+_TRUE_STRINGS = frozenset({"true", "on", "yes", "occupied", "present", "1"})
+_FALSE_STRINGS = frozenset({"false", "off", "no", "unoccupied", "not present", "away", "0"})
+
+# Candidate payload keys, in priority order.
+_THERMOSTAT_ID_KEYS = ("id", "thermostat_id", "identifier", "uuid")
+_THERMOSTAT_NAME_KEYS = ("name", "thermostat_name", "label")
+_REMOTE_SENSOR_ID_KEYS = ("id", "sensor_id", "identifier", "uuid", "remoteSensorId")
+_REMOTE_SENSOR_NAME_KEYS = ("name", "sensorName", "label", "room", "displayName")
+_IN_USE_KEYS = ("inUse", "in_use")
+_CAPABILITY_TYPE_KEYS = ("type", "name", "capability")
+_CAPABILITY_VALUE_KEYS = ("value", "val")
+# Most likely container first; "runtime" is checked separately before these.
+_AIR_QUALITY_CONTAINER_KEYS = (
+    "capabilities",
+    "capability",
+    "settings",
+    "equipment",
+    "air_quality",
+    "airQuality",
+)
+
+
+def pick_first_value(data: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Return the first non-None value from a dict for the provided keys.
+
+    Takes a tuple rather than varargs so callers can pass module-level key
+    tuples without repacking them on every call.
+    """
     for key in keys:
         value = data.get(key)
         if value is not None:
@@ -16,9 +53,18 @@ def pick_first_value(data: dict[str, Any], *keys: str) -> Any:
 def pick_first_nested_value(data: dict[str, Any], *paths: tuple[str, ...]) -> Any:
     """Return the first non-None value from nested dict paths."""
     for path in paths:
+        if len(path) == 2:
+            # Every current call site uses (container, key) paths.
+            outer, key = path
+            inner = data.get(outer)
+            if type(inner) is dict:
+                value = inner.get(key)
+                if value is not None:
+                    return value
+            continue
         current: Any = data
         for key in path:
-            if not isinstance(current, dict) or key not in current:
+            if type(current) is not dict or key not in current:
                 current = None
                 break
             current = current[key]
@@ -37,47 +83,37 @@ def pick_air_quality_value(
     if runtime_value is not None:
         return runtime_value
 
-    types = {runtime_key.lower(), *(key.lower() for key in fallback_keys)}
-    for container_key in (
-        "capabilities",
-        "capability",
-        "settings",
-        "equipment",
-        "air_quality",
-        "airQuality",
-    ):
+    keys = (runtime_key, *fallback_keys)
+    types = _air_quality_types(runtime_key, fallback_keys)
+    for container_key in _AIR_QUALITY_CONTAINER_KEYS:
         container = thermostat.get(container_key)
-        if isinstance(container, dict):
-            value = pick_first_value(container, runtime_key, *fallback_keys)
+        if container is None:
+            continue
+        if type(container) is dict:
+            value = pick_first_value(container, keys)
             if value is not None:
                 return value
-        elif isinstance(container, list):
+        elif type(container) is list:
             for item in container:
-                if not isinstance(item, dict):
+                if type(item) is not dict:
                     continue
-                cap_type = str(
-                    item.get("type") or item.get("name") or item.get("capability") or ""
-                ).lower()
-                if cap_type in types:
-                    value = item.get("value")
-                    if value is None:
-                        value = item.get("val")
+                if _capability_type(item) in types:
+                    value = pick_first_value(item, _CAPABILITY_VALUE_KEYS)
                     if value is not None:
                         return value
 
-    return pick_first_value(thermostat, runtime_key, *fallback_keys)
+    return pick_first_value(thermostat, keys)
+
+
+@lru_cache(maxsize=32)
+def _air_quality_types(runtime_key: str, fallback_keys: tuple[str, ...]) -> frozenset[str]:
+    return frozenset({runtime_key.lower(), *(key.lower() for key in fallback_keys)})
 
 
 def thermostat_id(thermostat: dict[str, Any]) -> str:
     """Return a stable thermostat id string."""
     return str(
-        pick_first_value(
-            thermostat,
-            "id",
-            "thermostat_id",
-            "identifier",
-            "uuid",
-        )
+        pick_first_value(thermostat, _THERMOSTAT_ID_KEYS)
         or "unknown"
     )
 
@@ -85,12 +121,7 @@ def thermostat_id(thermostat: dict[str, Any]) -> str:
 def thermostat_name(thermostat: dict[str, Any]) -> str:
     """Return a thermostat display name."""
     return str(
-        pick_first_value(
-            thermostat,
-            "name",
-            "thermostat_name",
-            "label",
-        )
+        pick_first_value(thermostat, _THERMOSTAT_NAME_KEYS)
         or "Thermostat"
     )
 
@@ -122,15 +153,32 @@ def thermostat_current_climate_name(thermostat: dict[str, Any]) -> str | None:
     return str(current_ref)
 
 
-def find_thermostat(
-    thermostats: list[dict[str, Any]],
-    thermostat_identifier: str,
-) -> dict[str, Any] | None:
-    """Find a thermostat dict by id."""
-    for thermostat in thermostats:
-        if thermostat_id(thermostat) == thermostat_identifier:
-            return thermostat
-    return None
+@dataclass(frozen=True)
+class NormalizedThermostats:
+    """Thermostat payloads for one coordinator refresh, indexed for lookups.
+
+    The coordinator's data is keyed by thermostat id rather than kept as the
+    raw list, so entities resolve their thermostat/remote sensor with a dict
+    lookup instead of scanning on every state read. Platform setup walks
+    `remotes_by_id` too, rather than re-extracting remote sensors itself.
+    """
+
+    by_id: dict[str, dict[str, Any]]
+    remotes_by_id: dict[str, dict[str, dict[str, Any]]]
+
+    @classmethod
+    def from_thermostats(cls, thermostats: list[dict[str, Any]]) -> NormalizedThermostats:
+        """Build the indexes in a single pass over the thermostat list."""
+        by_id: dict[str, dict[str, Any]] = {}
+        remotes_by_id: dict[str, dict[str, dict[str, Any]]] = {}
+        for thermostat in thermostats:
+            tid = thermostat_id(thermostat)
+            by_id[tid] = thermostat
+            remotes_by_id[tid] = {
+                remote_sensor_id(sensor, tid): sensor
+                for sensor in extract_remote_sensors(thermostat)
+            }
+        return cls(by_id=by_id, remotes_by_id=remotes_by_id)
 
 
 def extract_remote_sensors(thermostat: dict[str, Any]) -> list[dict[str, Any]]:
@@ -151,13 +199,13 @@ def extract_remote_sensors(thermostat: dict[str, Any]) -> list[dict[str, Any]]:
         "rooms",
     ):
         value = thermostat.get(key)
-        if isinstance(value, list):
-            sensors.extend([item for item in value if isinstance(item, dict)])
-        elif isinstance(value, dict):
+        if type(value) is list:
+            sensors.extend([item for item in value if type(item) is dict])
+        elif type(value) is dict:
             nested_list = value.get("sensors") or value.get("items")
-            if isinstance(nested_list, list):
-                sensors.extend([item for item in nested_list if isinstance(item, dict)])
-            elif all(isinstance(v, dict) for v in value.values()):
+            if type(nested_list) is list:
+                sensors.extend([item for item in nested_list if type(item) is dict])
+            elif all(type(v) is dict for v in value.values()):
                 sensors.extend(list(value.values()))
 
     filtered: list[dict[str, Any]] = []
@@ -238,14 +286,7 @@ def remote_sensor_id(sensor: dict[str, Any], thermostat_identifier: str) -> str:
     Important: ecobee remote sensor ids are not guaranteed to be globally unique
     across thermostats. We namespace by the parent thermostat id.
     """
-    sensor_id = pick_first_value(
-        sensor,
-        "id",
-        "sensor_id",
-        "identifier",
-        "uuid",
-        "remoteSensorId",
-    )
+    sensor_id = pick_first_value(sensor, _REMOTE_SENSOR_ID_KEYS)
     if sensor_id is not None:
         return f"{thermostat_identifier}:{sensor_id}"
     return f"{thermostat_identifier}:{remote_sensor_name(sensor)}"
@@ -254,14 +295,7 @@ def remote_sensor_id(sensor: dict[str, Any], thermostat_identifier: str) -> str:
 def remote_sensor_name(sensor: dict[str, Any]) -> str:
     """Return a remote sensor display name."""
     return str(
-        pick_first_value(
-            sensor,
-            "name",
-            "sensorName",
-            "label",
-            "room",
-            "displayName",
-        )
+        pick_first_value(sensor, _REMOTE_SENSOR_NAME_KEYS)
         or "Remote Sensor"
     )
 
@@ -276,7 +310,7 @@ def remote_sensor_temperature(sensor: dict[str, Any]) -> float | int | None:
         sensor,
         direct_keys=("temperature", "temp", "current_temperature"),
         nested_paths=(("data", "temperature"), ("runtime", "temperature")),
-        capability_types=("temperature", "temp"),
+        capability_types=_TEMPERATURE_CAPABILITIES,
     )
     num = _coerce_number(value)
     if num is None:
@@ -298,7 +332,7 @@ def remote_sensor_humidity(sensor: dict[str, Any]) -> float | int | None:
         sensor,
         direct_keys=("humidity", "current_humidity"),
         nested_paths=(("data", "humidity"), ("runtime", "humidity")),
-        capability_types=("humidity",),
+        capability_types=_HUMIDITY_CAPABILITIES,
     )
     return _coerce_number(value)
 
@@ -309,7 +343,7 @@ def remote_sensor_occupancy(sensor: dict[str, Any]) -> bool | None:
         sensor,
         direct_keys=("occupancy", "presence", "occupied"),
         nested_paths=(("data", "occupancy"), ("data", "presence")),
-        capability_types=("occupancy", "presence", "occupied"),
+        capability_types=_OCCUPANCY_CAPABILITIES,
     )
     return _coerce_bool(value)
 
@@ -319,7 +353,7 @@ def remote_sensor_in_use(sensor: dict[str, Any]) -> bool | None:
 
     Ecobee remote sensors include an `inUse` boolean.
     """
-    value = pick_first_value(sensor, "inUse", "in_use")
+    value = pick_first_value(sensor, _IN_USE_KEYS)
     return _coerce_bool(value)
 
 
@@ -328,9 +362,9 @@ def _extract_remote_sensor_value(
     *,
     direct_keys: tuple[str, ...],
     nested_paths: tuple[tuple[str, ...], ...],
-    capability_types: tuple[str, ...],
+    capability_types: frozenset[str],
 ) -> Any:
-    value = pick_first_value(sensor, *direct_keys)
+    value = pick_first_value(sensor, direct_keys)
     if value is not None:
         return value
 
@@ -341,30 +375,22 @@ def _extract_remote_sensor_value(
     return _extract_capability_value(sensor, capability_types)
 
 
-def _extract_capability_value(sensor: dict[str, Any], capability_types: tuple[str, ...]) -> Any:
-    types = {cap.lower() for cap in capability_types}
+def _extract_capability_value(sensor: dict[str, Any], types: frozenset[str]) -> Any:
     for list_key in ("capability", "capabilities", "capabilityList"):
         caps = sensor.get(list_key)
-        if isinstance(caps, list):
+        if type(caps) is list:
             for cap in caps:
-                if not isinstance(cap, dict):
+                if type(cap) is not dict:
                     continue
-                cap_type = str(
-                    cap.get("type") or cap.get("name") or cap.get("capability") or ""
-                ).lower()
-                if cap_type in types:
-                    value = cap.get("value")
-                    if value is None:
-                        value = cap.get("val")
+                if _capability_type(cap) in types:
+                    value = pick_first_value(cap, _CAPABILITY_VALUE_KEYS)
                     if value is not None:
                         return value
-        elif isinstance(caps, dict):
+        elif type(caps) is dict:
             for cap_key, cap_value in caps.items():
                 if str(cap_key).lower() in types:
-                    if isinstance(cap_value, dict):
-                        value = cap_value.get("value")
-                        if value is None:
-                            value = cap_value.get("val")
+                    if type(cap_value) is dict:
+                        value = pick_first_value(cap_value, _CAPABILITY_VALUE_KEYS)
                         if value is not None:
                             return value
                     else:
@@ -372,6 +398,15 @@ def _extract_capability_value(sensor: dict[str, Any], capability_types: tuple[st
     return None
 
 
+def _capability_type(cap: dict[str, Any]) -> str:
+    """Return the lowercased type of a capability item, or "" if it has none."""
+    for key in _CAPABILITY_TYPE_KEYS:
+        raw = cap.get(key)
+        if raw:
+            return raw.lower() if type(raw) is str else str(raw).lower()
+    return ""
+
+
 def _coerce_number(value: Any) -> float | int | None:
     if value is None:
         return None
@@ -401,8 +436,8 @@ def _coerce_bool(value: Any) -> bool | None:
         return bool(value)
     if isinstance(value, str):
         lowered = value.strip().lower()
-        if lowered in {"true", "on", "yes", "occupied", "present", "1"}:
+        if lowered in _TRUE_STRINGS:
             return True
-        if lowered in {"false", "off", "no", "unoccupied", "not present", "away", "0"}:
+        if lowered in _FALSE_STRINGS:
             return False
     return None
@@ -0,0 +1,41 @@
+"""Shared entity base and helpers for the Beestat platforms."""
+from __future__ import annotations
+
+from abc import abstractmethod
+from functools import lru_cache
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
+
+
+@lru_cache(maxsize=512)
+def suggested_object_id(name: str, key: str) -> str:
+    """Return the suggested object id for a device name + description key.
+
+    Every description of a thermostat/remote sensor slugifies the same device
+    name, and slugify is regex-heavy, so results are cached across entities and
+    entry reloads.
+    """
+    return f"beestat_{slugify(name)}_{key}"
+
+
+class BeestatCoordinatorEntity(CoordinatorEntity):
+    """Base for Beestat entities that cache their state in `_attr_*` attributes.
+
+    The value is resolved once per coordinator refresh in `_update_attrs`, so
+    Home Assistant's state reads are plain attribute lookups. The platforms
+    pass the value they probed at setup as the initial state, so an entity's
+    value function only runs once before its first refresh.
+    """
+
+    __slots__ = ()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    @abstractmethod
+    def _update_attrs(self) -> None:
+        """Recompute the entity's `_attr_*` state from `coordinator.data`."""
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -16,13 +17,9 @@ from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
 from .const import DOMAIN
 from .data import (
-    extract_remote_sensors,
-    find_thermostat,
     pick_air_quality_value,
     pick_first_nested_value,
     pick_first_value,
@@ -34,9 +31,44 @@ from .data import (
     thermostat_current_climate_name,
     thermostat_name,
 )
+from .entity import BeestatCoordinatorEntity, suggested_object_id
 
 
-@dataclass(frozen=True)
+def _hvac_mode_value(thermostat: dict[str, Any]) -> Any:
+    return pick_first_value(
+        thermostat,
+        ("hvac_mode", "mode", "hvacMode", "thermostat_mode"),
+    ) or pick_first_nested_value(thermostat, ("runtime", "hvacMode"))
+
+
+def _hvac_state_value(thermostat: dict[str, Any]) -> Any:
+    return pick_first_value(
+        thermostat,
+        ("hvac_state", "hvacState", "equipmentStatus", "equipment_status", "state"),
+    ) or pick_first_nested_value(thermostat, ("runtime", "equipmentStatus"))
+
+
+def _outdoor_temperature_value(thermostat: dict[str, Any]) -> Any:
+    return pick_first_nested_value(
+        thermostat,
+        ("weather", "temperature"),
+        ("weather", "temp"),
+        ("weather", "outdoor_temperature"),
+        ("weather", "outdoorTemperature"),
+    )
+
+
+def _outdoor_humidity_value(thermostat: dict[str, Any]) -> Any:
+    return pick_first_nested_value(
+        thermostat,
+        ("weather", "humidity_relative"),
+        ("weather", "humidity"),
+        ("weather", "outdoor_humidity"),
+        ("weather", "outdoorHumidity"),
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class BeestatSensorDescription(SensorEntityDescription):
     """Describe a Beestat sensor.
 
@@ -58,12 +90,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda hass: hass.config.units.temperature_unit,
-        value_fn=lambda thermostat: pick_first_value(
-            thermostat,
-            "temperature",
-            "temp",
-            "current_temperature",
-        ),
+        value_fn=partial(pick_first_value, keys=("temperature", "temp", "current_temperature")),
     ),
     BeestatSensorDescription(
         key="humidity",
@@ -71,11 +98,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda hass: PERCENTAGE,
-        value_fn=lambda thermostat: pick_first_value(
-            thermostat,
-            "humidity",
-            "current_humidity",
-        ),
+        value_fn=partial(pick_first_value, keys=("humidity", "current_humidity")),
     ),
     BeestatSensorDescription(
         key="heat_setpoint",
@@ -83,12 +106,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda hass: hass.config.units.temperature_unit,
-        value_fn=lambda thermostat: pick_first_value(
-            thermostat,
-            "setpoint_heat",
-            "heat_setpoint",
-            "heatSetpoint",
-        ),
+        value_fn=partial(pick_first_value, keys=("setpoint_heat", "heat_setpoint", "heatSetpoint")),
         optional=True,
     ),
     BeestatSensorDescription(
@@ -97,7 +115,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=None,
         state_class=None,
         unit_fn=lambda _hass: None,
-        value_fn=lambda thermostat: thermostat_current_climate_name(thermostat),
+        value_fn=thermostat_current_climate_name,
         optional=True,
     ),
     BeestatSensorDescription(
@@ -106,13 +124,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda hass: hass.config.units.temperature_unit,
-        value_fn=lambda thermostat: pick_first_nested_value(
-            thermostat,
-            ("weather", "temperature"),
-            ("weather", "temp"),
-            ("weather", "outdoor_temperature"),
-            ("weather", "outdoorTemperature"),
-        ),
+        value_fn=_outdoor_temperature_value,
         optional=True,
     ),
     BeestatSensorDescription(
@@ -121,13 +133,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda _hass: PERCENTAGE,
-        value_fn=lambda thermostat: pick_first_nested_value(
-            thermostat,
-            ("weather", "humidity_relative"),
-            ("weather", "humidity"),
-            ("weather", "outdoor_humidity"),
-            ("weather", "outdoorHumidity"),
-        ),
+        value_fn=_outdoor_humidity_value,
         optional=True,
     ),
     BeestatSensorDescription(
@@ -136,14 +142,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=None,
         state_class=None,
         unit_fn=lambda _hass: None,
-        value_fn=lambda thermostat: pick_first_value(
-            thermostat,
-            "hvac_mode",
-            "mode",
-            "hvacMode",
-            "thermostat_mode",
-        )
-        or pick_first_nested_value(thermostat, ("runtime", "hvacMode")),
+        value_fn=_hvac_mode_value,
         optional=True,
     ),
     BeestatSensorDescription(
@@ -152,15 +151,7 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=None,
         state_class=None,
         unit_fn=lambda _hass: None,
-        value_fn=lambda thermostat: pick_first_value(
-            thermostat,
-            "hvac_state",
-            "hvacState",
-            "equipmentStatus",
-            "equipment_status",
-            "state",
-        )
-        or pick_first_nested_value(thermostat, ("runtime", "equipmentStatus")),
+        value_fn=_hvac_state_value,
         optional=True,
     ),
     BeestatSensorDescription(
@@ -169,8 +160,8 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.CO2,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda _hass: "ppm",
-        value_fn=lambda thermostat: pick_air_quality_value(
-            thermostat,
+        value_fn=partial(
+            pick_air_quality_value,
             runtime_key="actualCO2",
             fallback_keys=("co2", "CO2", "co2_ppm", "air_quality_co2"),
         ),
@@ -184,8 +175,8 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=None,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda _hass: "ppb",
-        value_fn=lambda thermostat: pick_air_quality_value(
-            thermostat,
+        value_fn=partial(
+            pick_air_quality_value,
             runtime_key="actualVOC",
             fallback_keys=("voc", "VOC", "voc_ppb", "air_quality_voc"),
         ),
@@ -197,8 +188,8 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.AQI,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda _hass: None,
-        value_fn=lambda thermostat: pick_air_quality_value(
-            thermostat,
+        value_fn=partial(
+            pick_air_quality_value,
             runtime_key="actualAQScore",
             fallback_keys=("aq_score", "aqScore", "air_quality_score", "AQScore"),
         ),
@@ -210,8 +201,8 @@ SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=None,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda _hass: None,
-        value_fn=lambda thermostat: pick_air_quality_value(
-            thermostat,
+        value_fn=partial(
+            pick_air_quality_value,
             runtime_key="actualAQAccuracy",
             fallback_keys=("aq_accuracy", "aqAccuracy", "air_quality_accuracy", "AQAccuracy"),
         ),
@@ -226,7 +217,7 @@ REMOTE_SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda hass: hass.config.units.temperature_unit,
-        value_fn=lambda sensor: remote_sensor_temperature(sensor),
+        value_fn=remote_sensor_temperature,
     ),
     BeestatSensorDescription(
         key="humidity",
@@ -234,7 +225,7 @@ REMOTE_SENSOR_DESCRIPTIONS: tuple[BeestatSensorDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         unit_fn=lambda _hass: PERCENTAGE,
-        value_fn=lambda sensor: remote_sensor_humidity(sensor),
+        value_fn=remote_sensor_humidity,
         optional=True,
     ),
 )
@@ -248,9 +239,11 @@ async def async_setup_entry(
     """Set up Beestat sensors based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     entities: list[SensorEntity] = []
-    for thermostat in coordinator.data:
+    remotes_by_id = coordinator.data.remotes_by_id
+    for tid, thermostat in coordinator.data.by_id.items():
         for description in SENSOR_DESCRIPTIONS:
-            if description.optional and description.value_fn(thermostat) is None:
+            value = description.value_fn(thermostat)
+            if description.optional and value is None:
                 continue
             entities.append(
                 BeestatThermostatSensor(
@@ -258,11 +251,13 @@ async def async_setup_entry(
                     thermostat=thermostat,
                     description=description,
                     hass=hass,
+                    native_value=value,
                 )
             )
-        for remote_sensor in extract_remote_sensors(thermostat):
+        for remote_sensor in remotes_by_id[tid].values():
             for description in REMOTE_SENSOR_DESCRIPTIONS:
-                if description.optional and description.value_fn(remote_sensor) is None:
+                value = description.value_fn(remote_sensor)
+                if description.optional and value is None:
                     continue
                 entities.append(
                     BeestatRemoteSensor(
@@ -271,12 +266,13 @@ async def async_setup_entry(
                         remote_sensor=remote_sensor,
                         description=description,
                         hass=hass,
+                        native_value=value,
                     )
                 )
     async_add_entities(entities)
 
 
-class BeestatThermostatSensor(CoordinatorEntity, SensorEntity):
+class BeestatThermostatSensor(BeestatCoordinatorEntity, SensorEntity):
     """Representation of a Beestat thermostat sensor."""
 
     _attr_has_entity_name = True
@@ -287,49 +283,36 @@ class BeestatThermostatSensor(CoordinatorEntity, SensorEntity):
         thermostat: dict[str, Any],
         description: BeestatSensorDescription,
         hass: HomeAssistant,
+        native_value: Any = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        self._thermostat_id = _thermostat_id(thermostat)
-        self._thermostat_name = _thermostat_name(thermostat)
+        self._attr_name = description.name
+        self._attr_native_value = native_value
+        self._thermostat_id = thermostat_id(thermostat)
+        self._thermostat_name = thermostat_name(thermostat)
         self._hass = hass
         self._attr_unique_id = f"{self._thermostat_id}_{description.key}"
-        self._attr_suggested_object_id = f"beestat_{slugify(self._thermostat_name)}_{description.key}"
+        self._attr_suggested_object_id = suggested_object_id(self._thermostat_name, description.key)
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._thermostat_id)},
             name=self._thermostat_name,
             manufacturer="Beestat",
-            model=pick_first_value(thermostat, "model", "thermostat_model") or "Thermostat",
+            model=pick_first_value(thermostat, ("model", "thermostat_model")) or "Thermostat",
         )
 
-    @property
-    def name(self) -> str:
-        return self.entity_description.name
-
-    @property
-    def native_value(self) -> Any:
-        thermostat = _find_thermostat(self.coordinator.data, self._thermostat_id)
-        if thermostat is None:
-            return None
-        return self.entity_description.value_fn(thermostat)
+    def _update_attrs(self) -> None:
+        thermostat = self.coordinator.data.by_id.get(self._thermostat_id)
+        self._attr_native_value = (
+            self.entity_description.value_fn(thermostat) if thermostat is not None else None
+        )
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         return self.entity_description.unit_fn(self._hass)
 
-def _thermostat_id(thermostat: dict[str, Any]) -> str:
-    return thermostat_id(thermostat)
-
-
-def _thermostat_name(thermostat: dict[str, Any]) -> str:
-    return thermostat_name(thermostat)
-
 
-def _find_thermostat(thermostats: list[dict[str, Any]], thermostat_id: str) -> dict[str, Any] | None:
-    return find_thermostat(thermostats, thermostat_id)
-
-
-class BeestatRemoteSensor(CoordinatorEntity, SensorEntity):
+class BeestatRemoteSensor(BeestatCoordinatorEntity, SensorEntity):
     """Representation of a Beestat remote sensor."""
 
     _attr_has_entity_name = True
@@ -341,36 +324,33 @@ class BeestatRemoteSensor(CoordinatorEntity, SensorEntity):
         remote_sensor: dict[str, Any],
         description: BeestatSensorDescription,
         hass: HomeAssistant,
+        native_value: Any = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        self._thermostat_id = _thermostat_id(thermostat)
+        self._attr_name = description.name
+        self._attr_native_value = native_value
+        self._thermostat_id = thermostat_id(thermostat)
         self._remote_sensor_id = remote_sensor_id(remote_sensor, self._thermostat_id)
         self._remote_sensor_name = remote_sensor_name(remote_sensor)
         self._hass = hass
         self._attr_unique_id = f"{self._remote_sensor_id}_{description.key}"
-        self._attr_suggested_object_id = f"beestat_{slugify(self._remote_sensor_name)}_{description.key}"
+        self._attr_suggested_object_id = suggested_object_id(self._remote_sensor_name, description.key)
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._remote_sensor_id)},
             name=self._remote_sensor_name,
             manufacturer="Beestat",
-            model=pick_first_value(remote_sensor, "type", "model") or "Remote Sensor",
+            model=pick_first_value(remote_sensor, ("type", "model")) or "Remote Sensor",
             via_device=(DOMAIN, self._thermostat_id),
         )
 
-    @property
-    def name(self) -> str:
-        return self.entity_description.name
-
-    @property
-    def native_value(self) -> Any:
-        thermostat = _find_thermostat(self.coordinator.data, self._thermostat_id)
-        if thermostat is None:
-            return None
-        for sensor in extract_remote_sensors(thermostat):
-            if remote_sensor_id(sensor, self._thermostat_id) == self._remote_sensor_id:
-                return self.entity_description.value_fn(sensor)
-        return None
+    def _update_attrs(self) -> None:
+        sensor = self.coordinator.data.remotes_by_id.get(self._thermostat_id, {}).get(
+            self._remote_sensor_id
+        )
+        self._attr_native_value = (
+            self.entity_description.value_fn(sensor) if sensor is not None else None
+        )
 
     @property
     def native_unit_of_measurement(self) -> str | None:
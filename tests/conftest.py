@@ -1,12 +1,75 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.beestat.const import CONF_API_KEY, DOMAIN
+from tests.mock_client import MockBeestatApiClient
 
 
 @pytest.fixture
 def mock_config_entry() -> MockConfigEntry:
     return MockConfigEntry(domain=DOMAIN, data={CONF_API_KEY: "test-key"})
+
+
+@pytest.fixture
+def mock_client() -> MockBeestatApiClient:
+    # A fresh instance per test, so there is no state to reset afterwards.
+    return MockBeestatApiClient()
+
+
+# The payload fixtures are built once per session. They are only ever serialized
+# into mocked responses, so tests that need to mutate one should copy it first.
+@pytest.fixture(scope="session")
+def fake_thermostats() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": "t1",
+            "name": "Upstairs",
+            "ecobee_thermostat_id": "e1",
+            "temperature": 72,
+            "humidity": 40,
+            "setpoint_heat": 68,
+            "weather": {"temperature": 45.3, "humidity_relative": 92},
+        }
+    ]
+
+
+@pytest.fixture(scope="session")
+def fake_ecobee_thermostats() -> dict[str, dict[str, Any]]:
+    return {
+        "e1": {
+            "ecobee_thermostat_id": "e1",
+            "runtime": {
+                "actualCO2": 900,
+                "actualVOC": 120,
+                "actualAQScore": 85,
+                "actualAQAccuracy": 2,
+            },
+            "remote_sensors": [
+                {
+                    "id": "ei:0",
+                    "name": "Upstairs",
+                    "type": "thermostat",
+                    "inUse": True,
+                    "capability": [
+                        {"type": "occupancy", "value": "false"},
+                    ],
+                },
+                {
+                    "id": "rs2:100",
+                    "name": "Living",
+                    "type": "ecobee3_remote_sensor",
+                    "inUse": True,
+                    "capability": [
+                        {"type": "temperature", "value": "712"},
+                        {"type": "humidity", "value": "44"},
+                        {"type": "occupancy", "value": "true"},
+                    ],
+                },
+            ],
+        }
+    }
@@ -1,8 +1,11 @@
 """Mock Beestat API client for testing."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
+import orjson
+
 
 class BeestatApiError(Exception):
     """Beestat API error."""
@@ -14,6 +17,7 @@ class MockBeestatApiClient:
     Usage:
         client = MockBeestatApiClient(api_key="test_key")
         client.set_thermostats_response([{"id": "t1", "name": "Test"}])
+        client.set_thermostats_response_raw(b'[{"id": "t1", "name": "Test"}]')
         client.set_error_response("API key invalid")
 
     This class mirrors the interface of BeestatApiClient but doesn't require
@@ -24,14 +28,26 @@ class MockBeestatApiClient:
         """Initialize mock client."""
         self.api_key = api_key
         self._thermostats_response: list[dict[str, Any]] | None = None
+        self._thermostats_response_raw: bytes | None = None
         self._error_response: str | None = None
         self._call_count: int = 0
         self._last_request: dict[str, Any] | None = None
+        self._handlers: dict[tuple[str, str], Callable[[], Any]] = {
+            ("thermostat", "read_id"): self._handle_thermostats,
+        }
 
     def set_thermostats_response(self, thermostats: list[dict[str, Any]]) -> None:
         """Set the response for async_get_thermostats."""
         self._thermostats_response = thermostats
 
+    def set_thermostats_response_raw(self, payload: bytes) -> None:
+        """Set a JSON-encoded response, decoded on every async_get_thermostats call.
+
+        Unlike set_thermostats_response, each call returns a freshly decoded
+        object, like the real client does.
+        """
+        self._thermostats_response_raw = payload
+
     def set_error_response(self, error_message: str) -> None:
         """Set an error to raise on the next request."""
         self._error_response = error_message
@@ -60,12 +76,15 @@ class MockBeestatApiClient:
         if self._error_response:
             raise BeestatApiError(self._error_response)
 
-        if resource == "thermostat" and method == "read_id":
-            if self._thermostats_response is not None:
-                return self._thermostats_response
-            return []
+        handler = self._handlers.get((resource, method))
+        return handler() if handler is not None else None
 
-        return None
+    def _handle_thermostats(self) -> list[dict[str, Any]]:
+        if self._thermostats_response_raw is not None:
+            return orjson.loads(self._thermostats_response_raw)
+        if self._thermostats_response is not None:
+            return self._thermostats_response
+        return []
 
     async def async_get_thermostats(self) -> list[dict[str, Any]]:
         """Return mock thermostat data."""
@@ -1,18 +1,221 @@
-from tests._load_module import load_module
+from __future__ import annotations
 
-api = load_module("custom_components.beestat.api", "custom_components/beestat/api.py")
+import asyncio
+import gc
+import json
+import logging
+from contextlib import asynccontextmanager
+
+import aiohttp
+import pytest
+
+from custom_components.beestat import api
 
 
 def test_build_payload_includes_required_fields():
     payload = api.build_payload("key123", "thermostat", "read", {"limit": 1})
+    assert json.loads(payload.pop("arguments")) == {"limit": 1}
     assert payload == {
         "api_key": "key123",
         "resource": "thermostat",
         "method": "read",
-        "arguments": "{\"limit\": 1}",
     }
 
 
 def test_build_payload_omits_arguments_when_none():
     payload = api.build_payload("key123", "thermostat", "read", None)
     assert "arguments" not in payload
+
+
+def test_build_payload_encodes_empty_arguments():
+    payload = api.build_payload("key123", "thermostat", "read", {})
+    assert payload["arguments"] == "{}"
+
+
+def test_parse_retry_after_seconds():
+    assert api.parse_retry_after("120") == 120
+    assert api.parse_retry_after(" 5 ") == 5
+    assert api.parse_retry_after(None) is None
+    assert api.parse_retry_after("") is None
+    # Only delta-seconds; float spellings would overflow timedelta().
+    assert api.parse_retry_after("inf") is None
+    assert api.parse_retry_after("1e20") is None
+    assert api.parse_retry_after("-5") is None
+    # Oversized values parse; the coordinator clamps them to its backoff cap.
+    assert api.parse_retry_after("99999999999999999999") == 99999999999999999999
+    # HTTP-date form isn't supported; fall back to our own backoff.
+    assert api.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+
+class _FakeResponse:
+    status = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, data=None) -> None:
+        self._data = [{"id": "t1"}] if data is None else data
+
+    async def json(self, loads=None):
+        return {"success": True, "data": self._data}
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @asynccontextmanager
+    async def post(self, url, **kwargs):
+        self.calls += 1
+        # Yield to the loop so concurrent callers overlap with this request.
+        await asyncio.sleep(0)
+        yield _FakeResponse()
+
+
+class _ErrorResponse:
+    def __init__(self, status, headers=None) -> None:
+        self.status = status
+        self.headers = headers or {}
+
+    async def text(self):
+        return "unavailable"
+
+
+class _ErrorSession:
+    def __init__(self, response) -> None:
+        self.response = response
+
+    @asynccontextmanager
+    async def post(self, url, **kwargs):
+        yield self.response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "headers", "retry_after"),
+    [(429, {"Retry-After": "120"}, 120), (429, {}, None), (503, {}, None)],
+)
+async def test_throttled_responses_raise_rate_limit_error(status, headers, retry_after):
+    session = _ErrorSession(_ErrorResponse(status, headers))
+    client = api.BeestatApiClient("key123", session, logging.getLogger(__name__))
+
+    with pytest.raises(api.BeestatRateLimitError) as excinfo:
+        await client.request("thermostat", "read_id")
+    assert excinfo.value.retry_after == retry_after
+
+
+@pytest.mark.asyncio
+async def test_other_http_errors_are_not_rate_limits():
+    session = _ErrorSession(_ErrorResponse(403))
+    client = api.BeestatApiClient("key123", session, logging.getLogger(__name__))
+
+    with pytest.raises(api.BeestatApiError) as excinfo:
+        await client.request("thermostat", "read_id")
+    assert not isinstance(excinfo.value, api.BeestatRateLimitError)
+
+
+@pytest.mark.asyncio
+async def test_request_shares_inflight_duplicate_calls():
+    session = _FakeSession()
+    client = api.BeestatApiClient("key123", session, logging.getLogger(__name__))
+
+    first, second = await asyncio.gather(
+        client.request("thermostat", "read_id"),
+        client.request("thermostat", "read_id"),
+    )
+
+    assert session.calls == 1
+    assert first == second == [{"id": "t1"}]
+
+    # Once settled, a new request goes back to the network.
+    await client.request("thermostat", "read_id")
+    assert session.calls == 2
+
+
+class _SyncingSession:
+    """Serve reads of whatever state Beestat had when the POST was sent."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.synced = False
+        self.release_reads = asyncio.Event()
+
+    @asynccontextmanager
+    async def post(self, url, data, **kwargs):
+        body = json.loads(data)
+        if body["method"] == "sync":
+            self.synced = True
+            yield _FakeResponse({})
+            return
+        self.reads += 1
+        payload = [{"id": "t1", "synced": self.synced}]
+        await self.release_reads.wait()
+        yield _FakeResponse(payload)
+
+
+@pytest.mark.asyncio
+async def test_read_after_sync_does_not_join_presync_request():
+    session = _SyncingSession()
+    client = api.BeestatApiClient("key123", session, logging.getLogger(__name__))
+
+    presync = asyncio.ensure_future(client.async_get_thermostats())
+    await asyncio.sleep(0)
+    await client.async_sync_thermostats()
+    postsync = asyncio.ensure_future(client.async_get_thermostats())
+    await asyncio.sleep(0)
+    session.release_reads.set()
+
+    assert await presync == [{"id": "t1", "synced": False}]
+    assert await postsync == [{"id": "t1", "synced": True}]
+    assert session.reads == 2
+
+
+class _FailingSession:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+
+    @asynccontextmanager
+    async def post(self, url, **kwargs):
+        await self.release.wait()
+        raise aiohttp.ClientError("boom")
+        yield  # Unreachable; makes this an async generator for asynccontextmanager.
+
+
+@pytest.mark.asyncio
+async def test_error_is_retrieved_when_every_caller_is_cancelled():
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+    try:
+        session = _FailingSession()
+        client = api.BeestatApiClient("key123", session, logging.getLogger(__name__))
+
+        caller = asyncio.ensure_future(client.request("thermostat", "read_id"))
+        await asyncio.sleep(0)
+        (future,) = client._inflight.values()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        session.release.set()
+        await asyncio.wait([future])
+        assert not client._inflight
+        del future
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+async def test_cancel_inflight_stops_running_requests():
+    session = _FailingSession()
+    client = api.BeestatApiClient("key123", session, logging.getLogger(__name__))
+
+    caller = asyncio.ensure_future(client.request("thermostat", "read_id"))
+    await asyncio.sleep(0)
+    client.cancel_inflight()
+
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert not client._inflight
@@ -1,6 +1,4 @@
-from tests._load_module import load_module
-
-data = load_module("custom_components.beestat.data", "custom_components/beestat/data.py")
+from custom_components.beestat import data
 
 
 def test_pick_air_quality_prefers_runtime():
@@ -44,3 +42,15 @@ def test_remote_sensor_values_from_capabilities():
     assert data.remote_sensor_temperature(sensor) == 72.5
     assert data.remote_sensor_humidity(sensor) == 45
     assert data.remote_sensor_occupancy(sensor) is True
+
+
+def test_normalized_thermostats_indexes_remotes_by_thermostat():
+    thermostats = [
+        {"id": "t1", "remote_sensors": [{"id": "rs:1", "name": "Living"}]},
+        {"id": "t2", "remote_sensors": [{"id": "rs:1", "name": "Office"}]},
+    ]
+    normalized = data.NormalizedThermostats.from_thermostats(thermostats)
+    assert list(normalized.by_id) == ["t1", "t2"]
+    assert normalized.by_id["t2"] is thermostats[1]
+    assert normalized.remotes_by_id["t1"]["t1:rs:1"]["name"] == "Living"
+    assert normalized.remotes_by_id["t2"]["t2:rs:1"]["name"] == "Office"
@@ -1,71 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import timedelta
+
 import pytest
 
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import entity_platform, entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMockResponse
 
-from custom_components.beestat.const import API_ENDPOINT
+from custom_components.beestat.const import (
+    API_ENDPOINT,
+    DEFAULT_UPDATE_INTERVAL_MINUTES,
+    DOMAIN,
+    MAX_BACKOFF_INTERVAL_SECONDS,
+)
 
 
-@pytest.mark.asyncio
-async def test_setup_creates_entities(
-    hass, mock_config_entry, enable_custom_integrations, aioclient_mock
-):
-    """Basic smoke test: integration sets up without throwing and registers sensors."""
+def _mock_beestat_api(aioclient_mock, responses, errors=None, synced_responses=None):
+    """Answer Beestat POSTs from (resource, method) tables.
 
-    fake_thermostats = [
-        {
-            "id": "t1",
-            "name": "Upstairs",
-            "ecobee_thermostat_id": "e1",
-            "temperature": 72,
-            "humidity": 40,
-            "setpoint_heat": 68,
-            "weather": {"temperature": 45.3, "humidity_relative": 92},
-        }
-    ]
-
-    fake_ecobee_thermostats = {
-        "e1": {
-            "ecobee_thermostat_id": "e1",
-            "runtime": {
-                "actualCO2": 900,
-                "actualVOC": 120,
-                "actualAQScore": 85,
-                "actualAQAccuracy": 2,
-            },
-            "remote_sensors": [
-                {
-                    "id": "ei:0",
-                    "name": "Upstairs",
-                    "type": "thermostat",
-                    "inUse": True,
-                    "capability": [
-                        {"type": "occupancy", "value": "false"},
-                    ],
-                },
-                {
-                    "id": "rs2:100",
-                    "name": "Living",
-                    "type": "ecobee3_remote_sensor",
-                    "inUse": True,
-                    "capability": [
-                        {"type": "temperature", "value": "712"},
-                        {"type": "humidity", "value": "44"},
-                        {"type": "occupancy", "value": "true"},
-                    ],
-                },
-            ],
-        }
-    }
-
-    from pytest_homeassistant_custom_component.test_util.aiohttp import (
-        AiohttpClientMockResponse,
-    )
+    `errors` maps (resource, method) to (status, headers) and wins over `responses`;
+    once any sync has been requested, `synced_responses` wins over both. Tests may
+    mutate the dicts between refreshes. Returns the list of (resource, method)
+    pairs requested, in order.
+    """
+    errors = {} if errors is None else errors
+    synced_responses = {} if synced_responses is None else synced_responses
+    calls: list[tuple[str | None, str | None]] = []
 
     async def _handler(method, url, data):
         # pytest-homeassistant-custom-component may hand us either the payload directly,
-        # or a wrapper like {"json": payload}.
+        # the raw request body, or a wrapper like {"json": payload}.
+        if isinstance(data, (bytes, str)):
+            data = json.loads(data)
         if isinstance(data, dict) and "json" in data and isinstance(data["json"], dict):
             body = data["json"]
         elif isinstance(data, dict):
@@ -73,28 +43,28 @@ async def test_setup_creates_entities(
         else:
             body = {}
 
-        resource = body.get("resource")
-        api_method = body.get("method")
+        key = (body.get("resource"), body.get("method"))
+        synced = any(api_method == "sync" for _, api_method in calls)
+        calls.append(key)
 
-        if resource == "thermostat" and api_method == "read_id":
+        if synced and (payload := synced_responses.get(key)) is not None:
             return AiohttpClientMockResponse(
                 method=method,
                 url=url,
-                json={"success": True, "data": fake_thermostats},
+                json={"success": True, "data": payload},
             )
 
-        if resource == "ecobee_thermostat" and api_method == "read_id":
+        if (error := errors.get(key)) is not None:
+            status, headers = error
             return AiohttpClientMockResponse(
-                method=method,
-                url=url,
-                json={"success": True, "data": fake_ecobee_thermostats},
+                method=method, url=url, status=status, text="throttled", headers=headers
             )
 
-        if api_method == "sync":
+        if (payload := responses.get(key)) is not None:
             return AiohttpClientMockResponse(
                 method=method,
                 url=url,
-                json={"success": True, "data": {}},
+                json={"success": True, "data": payload},
             )
 
         return AiohttpClientMockResponse(
@@ -103,28 +73,201 @@ async def test_setup_creates_entities(
             status=400,
             json={
                 "success": False,
-                "data": {"error_code": 999, "error_message": f"Unexpected {resource}/{api_method}"},
+                "data": {"error_code": 999, "error_message": f"Unexpected {key[0]}/{key[1]}"},
             },
         )
 
     aioclient_mock.post(API_ENDPOINT, side_effect=_handler)
+    return calls
+
+
+async def _async_wait_for_background_tasks(hass):
+    """Wait for tasks from async_create_background_task, e.g. the startup sync."""
+    try:
+        await hass.async_block_till_done(wait_background_tasks=True)
+    except TypeError:
+        # Older Home Assistant has no wait_background_tasks argument.
+        await asyncio.gather(*hass._background_tasks)
+        await hass.async_block_till_done()
+
+
+def _responses(fake_thermostats, fake_ecobee_thermostats):
+    # The sync endpoints only need a successful empty response.
+    return {
+        ("thermostat", "read_id"): fake_thermostats,
+        ("ecobee_thermostat", "read_id"): fake_ecobee_thermostats,
+        ("thermostat", "sync"): {},
+        ("sensor", "sync"): {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_setup_creates_entities(
+    hass,
+    mock_config_entry,
+    enable_custom_integrations,
+    aioclient_mock,
+    fake_thermostats,
+    fake_ecobee_thermostats,
+):
+    """Basic smoke test: integration sets up without throwing and registers sensors."""
+    _mock_beestat_api(aioclient_mock, _responses(fake_thermostats, fake_ecobee_thermostats))
 
     mock_config_entry.add_to_hass(hass)
     assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
     await hass.async_block_till_done()
 
     registry = er.async_get(hass)
-    entities = [e for e in registry.entities.values() if e.platform == "beestat"]
+    unique_ids = {e.unique_id for e in registry.entities.values() if e.platform == "beestat"}
 
     # Base thermostat sensors.
-    assert any(e.unique_id == "t1_temperature" for e in entities)
-    assert any(e.unique_id == "t1_humidity" for e in entities)
+    assert "t1_temperature" in unique_ids
+    assert "t1_humidity" in unique_ids
 
     # Binary sensors should exist (would have caught the EntityDescription subclass issue).
-    assert any(e.unique_id == "t1_occupancy" for e in entities)
-    assert any(e.unique_id == "t1_in_use" for e in entities)
+    assert "t1_occupancy" in unique_ids
+    assert "t1_in_use" in unique_ids
 
     # Remote sensor entities should exist (namespaced unique_ids).
-    assert any(e.unique_id == "t1:rs2:100_temperature" for e in entities)
-    assert any(e.unique_id == "t1:rs2:100_occupancy" for e in entities)
-    assert any(e.unique_id == "t1:rs2:100_in_use" for e in entities)
+    assert "t1:rs2:100_temperature" in unique_ids
+    assert "t1:rs2:100_occupancy" in unique_ids
+    assert "t1:rs2:100_in_use" in unique_ids
+
+    # Binary sensor state is resolved from coordinator data when the entity is added.
+    living_occupancy = registry.async_get_entity_id("binary_sensor", "beestat", "t1:rs2:100_occupancy")
+    thermostat_occupancy = registry.async_get_entity_id("binary_sensor", "beestat", "t1_occupancy")
+    assert hass.states.get(living_occupancy).state == "on"
+    assert hass.states.get(thermostat_occupancy).state == "off"
+    living_temperature = registry.async_get_entity_id("sensor", "beestat", "t1:rs2:100_temperature")
+    assert hass.states.get(living_temperature).state == "71.2"
+
+    # Coordinator entities must never fall back to per-entity polling.
+    platform_entities = [
+        entity
+        for platform in entity_platform.async_get_platforms(hass, "beestat")
+        for entity in platform.entities.values()
+    ]
+    assert platform_entities
+    assert not any(entity.should_poll for entity in platform_entities)
+
+
+@pytest.mark.asyncio
+async def test_throttled_refreshes_back_off_and_recover(
+    hass,
+    mock_config_entry,
+    enable_custom_integrations,
+    aioclient_mock,
+    fake_thermostats,
+    fake_ecobee_thermostats,
+):
+    """429s back off up to the cap, honoring Retry-After; success restores the interval."""
+    errors: dict = {}
+    _mock_beestat_api(
+        aioclient_mock, _responses(fake_thermostats, fake_ecobee_thermostats), errors
+    )
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    configured = timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
+    assert coordinator.update_interval == configured
+
+    errors[("thermostat", "read_id")] = (429, None)
+    intervals = []
+    for _ in range(5):
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        intervals.append(coordinator.update_interval)
+    cap = timedelta(seconds=MAX_BACKOFF_INTERVAL_SECONDS)
+    assert intervals == [configured * 2, configured * 4, configured * 8, cap, cap]
+
+    errors.clear()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.update_interval == configured
+
+    # Retry-After is a floor over our own backoff...
+    errors[("thermostat", "read_id")] = (429, {"Retry-After": "1800"})
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=1800)
+
+    # ...but never beyond the cap.
+    errors[("thermostat", "read_id")] = (429, {"Retry-After": "99999999999999999999"})
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == cap
+
+    # Unparseable values fall back to our own doubling instead of failing the refresh.
+    errors[("thermostat", "read_id")] = (429, {"Retry-After": "inf"})
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == configured * 8
+
+    errors.clear()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.update_interval == configured
+
+
+@pytest.mark.asyncio
+async def test_startup_sync_reaches_entities(
+    hass,
+    mock_config_entry,
+    enable_custom_integrations,
+    aioclient_mock,
+    fake_thermostats,
+    fake_ecobee_thermostats,
+):
+    """Data from the startup sync is pushed to entities after their setup probe."""
+    synced_thermostats = [{**fake_thermostats[0], "temperature": 75}]
+    calls = _mock_beestat_api(
+        aioclient_mock,
+        _responses(fake_thermostats, fake_ecobee_thermostats),
+        synced_responses={("thermostat", "read_id"): synced_thermostats},
+    )
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await _async_wait_for_background_tasks(hass)
+
+    assert ("thermostat", "sync") in calls
+    assert ("sensor", "sync") in calls
+    registry = er.async_get(hass)
+    temperature = registry.async_get_entity_id("sensor", "beestat", "t1_temperature")
+    assert hass.states.get(temperature).state == "75"
+
+
+@pytest.mark.asyncio
+async def test_sync_timer_pushes_data_only_while_listened_to(
+    hass,
+    mock_config_entry,
+    enable_custom_integrations,
+    aioclient_mock,
+    fake_thermostats,
+    fake_ecobee_thermostats,
+):
+    """The hourly sync pushes fresh data, and stops once no entity is listening."""
+    responses = _responses(fake_thermostats, fake_ecobee_thermostats)
+    calls = _mock_beestat_api(aioclient_mock, responses)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await _async_wait_for_background_tasks(hass)
+    registry = er.async_get(hass)
+    temperature = registry.async_get_entity_id("sensor", "beestat", "t1_temperature")
+
+    responses[("thermostat", "read_id")] = [{**fake_thermostats[0], "temperature": 75}]
+    calls.clear()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=1))
+    await _async_wait_for_background_tasks(hass)
+    assert ("thermostat", "sync") in calls
+    assert ("sensor", "sync") in calls
+    assert hass.states.get(temperature).state == "75"
+
+    # Removing every entity drops the coordinator's listeners; the entry's timer lives on.
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    assert coordinator.listener_count > 0
+    for entry in er.async_entries_for_config_entry(registry, mock_config_entry.entry_id):
+        registry.async_remove(entry.entity_id)
+    await hass.async_block_till_done()
+    assert coordinator.listener_count == 0
+    calls.clear()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=2))
+    await _async_wait_for_background_tasks(hass)
+    assert calls == []
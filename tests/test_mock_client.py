@@ -3,51 +3,59 @@ from __future__ import annotations
 
 import pytest
 
-from tests.mock_client import MockBeestatApiClient, BeestatApiError
+from tests.mock_client import BeestatApiError
 
 
 @pytest.mark.asyncio
-async def test_mock_client_returns_configured_thermostats():
+async def test_mock_client_returns_configured_thermostats(mock_client):
     """Test that mock client returns configured thermostat data."""
-    client = MockBeestatApiClient()
     thermostats = [{"id": "t1", "name": "Upstairs", "temperature": 72}]
-    client.set_thermostats_response(thermostats)
+    mock_client.set_thermostats_response(thermostats)
 
-    result = await client.async_get_thermostats()
+    result = await mock_client.async_get_thermostats()
 
     assert result == thermostats
-    assert client.call_count == 1
+    assert mock_client.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_mock_client_default_empty_list():
-    """Test that mock client returns empty list by default."""
-    client = MockBeestatApiClient()
+async def test_mock_client_decodes_raw_thermostats_response(mock_client):
+    """Test that a raw response is decoded into a fresh object per call."""
+    mock_client.set_thermostats_response_raw(b'[{"id": "t1", "temperature": 72}]')
+
+    first = await mock_client.async_get_thermostats()
+    second = await mock_client.async_get_thermostats()
+
+    assert first == [{"id": "t1", "temperature": 72}]
+    assert first == second
+    assert first is not second
 
-    result = await client.async_get_thermostats()
+
+@pytest.mark.asyncio
+async def test_mock_client_default_empty_list(mock_client):
+    """Test that mock client returns empty list by default."""
+    result = await mock_client.async_get_thermostats()
 
     assert result == []
 
 
 @pytest.mark.asyncio
-async def test_mock_client_error_response():
+async def test_mock_client_error_response(mock_client):
     """Test that mock client raises error when configured."""
-    client = MockBeestatApiClient()
-    client.set_error_response("API key invalid")
+    mock_client.set_error_response("API key invalid")
 
     with pytest.raises(BeestatApiError, match="API key invalid"):
-        await client.async_get_thermostats()
+        await mock_client.async_get_thermostats()
 
 
 @pytest.mark.asyncio
-async def test_mock_client_tracks_last_request():
+async def test_mock_client_tracks_last_request(mock_client):
     """Test that mock client tracks the last request."""
-    client = MockBeestatApiClient()
-    client.set_thermostats_response([{"id": "t1"}])
+    mock_client.set_thermostats_response([{"id": "t1"}])
 
-    await client.request("thermostat", "read_id", {"limit": 10})
+    await mock_client.request("thermostat", "read_id", {"limit": 10})
 
-    assert client.last_request == {
+    assert mock_client.last_request == {
         "resource": "thermostat",
         "method": "read_id",
         "arguments": {"limit": 10},
@@ -55,26 +63,24 @@ async def test_mock_client_tracks_last_request():
 
 
 @pytest.mark.asyncio
-async def test_mock_client_call_count():
+async def test_mock_client_call_count(mock_client):
     """Test that mock client tracks call count."""
-    client = MockBeestatApiClient()
-    client.set_thermostats_response([])
+    mock_client.set_thermostats_response([])
 
-    assert client.call_count == 0
-    await client.async_get_thermostats()
-    assert client.call_count == 1
-    await client.async_get_thermostats()
-    assert client.call_count == 2
+    assert mock_client.call_count == 0
+    await mock_client.async_get_thermostats()
+    assert mock_client.call_count == 1
+    await mock_client.async_get_thermostats()
+    assert mock_client.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_mock_client_reset():
+async def test_mock_client_reset(mock_client):
     """Test that mock client can be reset."""
-    client = MockBeestatApiClient()
-    client.set_thermostats_response([{"id": "t1"}])
-    await client.async_get_thermostats()
+    mock_client.set_thermostats_response([{"id": "t1"}])
+    await mock_client.async_get_thermostats()
 
-    client.reset()
+    mock_client.reset()
 
-    assert client.call_count == 0
-    assert client.last_request is None
+    assert mock_client.call_count == 0
+    assert mock_client.last_request is None